@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from multiprocessing import Pool
+
+from generate_client_proposal import main as generate_client_proposal
+from generate_master_documentation import main as generate_master_documentation
+
+
+def _run(task) -> None:
+    task()
+
+
+def main() -> None:
+    # The two documents are independent, so build and save them in parallel;
+    # total wall time becomes max(proposal, master) instead of their sum.
+    with Pool(2) as pool:
+        pool.map(_run, (generate_client_proposal, generate_master_documentation))
+
+
+if __name__ == "__main__":
+    main()
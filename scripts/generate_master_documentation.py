@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import io
 import os
+from copy import deepcopy
 from datetime import date
+from xml.sax.saxutils import escape, quoteattr
 
 from docx import Document
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.oxml import OxmlElement
-from docx.oxml.ns import qn
+from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_TAB_ALIGNMENT
+from docx.oxml import OxmlElement, parse_xml
+from docx.oxml.ns import nsdecls, qn
 from docx.shared import Inches, Pt
 
 
@@ -18,22 +21,32 @@ FALLBACK_OUTPUT_PATH = os.path.join(
     "data",
     "Inventory_Management_System_Master_Documentation.docx",
 )
+# Normalized once at import; main() would otherwise re-run abspath (and the
+# ".." collapse) on every save attempt.
+_FALLBACK_ABS = os.path.abspath(FALLBACK_OUTPUT_PATH)
 SYSTEM_NAME = "Inventory Management System"
 VERSION = "1.0"
 PREPARED_BY = "Engineering / Inventory Management Portal Team"
 TODAY = date.today().strftime("%Y-%m-%d")
 CONFIDENTIAL_NOTE = "CONFIDENTIAL — Internal Use Only"
 
+# Qualified names resolved once; qn() re-derives the Clark notation from the
+# prefix map on every call.
+_QN_SECTPR = qn("w:sectPr")
+_QN_VAL = qn("w:val")
+_QN_TYPE = qn("w:type")
+_QN_SPACE = qn("xml:space")
+
 
 def _add_field_simple(paragraph, instr: str) -> None:
-    fld = OxmlElement("w:fldSimple")
-    fld.set(qn("w:instr"), instr)
-    r = OxmlElement("w:r")
-    t = OxmlElement("w:t")
-    t.text = " "
-    r.append(t)
-    fld.append(r)
-    paragraph._p.append(fld)
+    # One parse_xml call for the whole subtree instead of three OxmlElement
+    # allocations plus two appends.
+    paragraph._p.append(
+        parse_xml(
+            f'<w:fldSimple {nsdecls("w")} w:instr={quoteattr(instr)}>'
+            '<w:r><w:t xml:space="preserve"> </w:t></w:r></w:fldSimple>'
+        )
+    )
 
 
 def _set_normal_style(doc: Document) -> None:
@@ -58,25 +71,17 @@ def _add_header_footer(doc: Document) -> None:
     hp.text = f"{SYSTEM_NAME} — v{VERSION}"
     hp.alignment = WD_ALIGN_PARAGRAPH.CENTER
 
-    # Footer (default, not first page): table for left/right layout
+    # Footer (default, not first page): a right tab stop puts the page count
+    # on the far edge without the 1x2 layout table Word would otherwise have
+    # to lay out on every page.
     footer = section.footer
     fp = footer.paragraphs[0] if footer.paragraphs else footer.add_paragraph()
-    fp.text = ""
-
-    table = footer.add_table(rows=1, cols=2, width=Inches(6.5))
-    left = table.rows[0].cells[0]
-    right = table.rows[0].cells[1]
-
-    lp = left.paragraphs[0]
-    lp.text = CONFIDENTIAL_NOTE
-    lp.alignment = WD_ALIGN_PARAGRAPH.LEFT
-
-    rp = right.paragraphs[0]
-    rp.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-    rp.add_run("Page ")
-    _add_field_simple(rp, "PAGE")
-    rp.add_run(" of ")
-    _add_field_simple(rp, "NUMPAGES")
+    fp.paragraph_format.tab_stops.add_tab_stop(Inches(6.5), WD_TAB_ALIGNMENT.RIGHT)
+    fp.add_run(CONFIDENTIAL_NOTE + "\t")
+    fp.add_run("Page ")
+    _add_field_simple(fp, "PAGE")
+    fp.add_run(" of ")
+    _add_field_simple(fp, "NUMPAGES")
 
 
 def _title_page(doc: Document) -> None:
@@ -104,48 +109,275 @@ def _title_page(doc: Document) -> None:
 
 
 def _toc(doc: Document) -> None:
-    doc.add_heading("Table of Contents", level=1)
+    # Direct node insert; add_heading() would resolve "Heading 1" by name
+    # through the styles part.
+    doc.element.body.find(_QN_SECTPR).addprevious(
+        _make_p("Table of Contents", "Heading1")
+    )
     p = doc.add_paragraph()
     _add_field_simple(p, 'TOC \\o \"1-3\" \\h \\z \\u')
     doc.add_page_break()
 
 
 def _version_history(doc: Document) -> None:
-    doc.add_heading("Version History", level=1)
-    table = doc.add_table(rows=1, cols=4)
-    hdr = table.rows[0].cells
-    hdr[0].text = "Version"
-    hdr[1].text = "Date"
-    hdr[2].text = "Description"
-    hdr[3].text = "Author"
-
-    row = table.add_row().cells
-    row[0].text = VERSION
-    row[1].text = TODAY
-    row[2].text = "Initial master documentation for Phase 0–5 implementation."
-    row[3].text = PREPARED_BY
+    sect_pr = doc.element.body.find(_QN_SECTPR)
+    sect_pr.addprevious(_make_p("Version History", "Heading1"))
+
+    # The whole two-row table is rendered and parsed in one pass; the
+    # add_table/add_row path rebuilds a paragraph and run per cell through
+    # eight Cell.text assignments.
+    rows = (
+        ("Version", "Date", "Description", "Author"),
+        (
+            VERSION,
+            TODAY,
+            "Initial master documentation for Phase 0–5 implementation.",
+            PREPARED_BY,
+        ),
+    )
+    trs = "".join(
+        "<w:tr>"
+        + "".join(
+            f'<w:tc><w:p><w:r><w:t xml:space="preserve">{escape(cell)}</w:t></w:r></w:p></w:tc>'
+            for cell in row
+        )
+        + "</w:tr>"
+        for row in rows
+    )
+    sect_pr.addprevious(
+        parse_xml(
+            f'<w:tbl {nsdecls("w")}><w:tblPr/>'
+            "<w:tblGrid><w:gridCol/><w:gridCol/><w:gridCol/><w:gridCol/></w:tblGrid>"
+            f"{trs}</w:tbl>"
+        )
+    )
 
     doc.add_page_break()
 
 
-def _h1(doc: Document, title: str) -> None:
-    doc.add_heading(title, level=1)
+def _make_p(text: str, style_id: str | None = None) -> OxmlElement:
+    """Build a complete <w:p> element without going through add_paragraph."""
+    p = OxmlElement("w:p")
+    if style_id is not None:
+        ppr = OxmlElement("w:pPr")
+        pstyle = OxmlElement("w:pStyle")
+        pstyle.set(_QN_VAL, style_id)
+        ppr.append(pstyle)
+        p.append(ppr)
+    r = OxmlElement("w:r")
+    t = OxmlElement("w:t")
+    t.set(_QN_SPACE, "preserve")
+    t.text = text
+    r.append(t)
+    p.append(r)
+    return p
+
+
+def _page_break_p() -> OxmlElement:
+    p = OxmlElement("w:p")
+    r = OxmlElement("w:r")
+    br = OxmlElement("w:br")
+    br.set(_QN_TYPE, "page")
+    r.append(br)
+    p.append(r)
+    return p
+
+
+# Same-style paragraph runs (the numbered step guides) render as one XML
+# string and parse in a single C-level pass instead of four OxmlElement
+# allocations per step.
+_STYLED_P_TMPL = (
+    '<w:p><w:pPr><w:pStyle w:val="%s"/></w:pPr>'
+    '<w:r><w:t xml:space="preserve">%s</w:t></w:r></w:p>'
+)
+_BATCH_ROOT_TMPL = f'<w:root {nsdecls("w")}>%s</w:root>'
+
+
+def _parse_styled_ps(style_id: str, texts: tuple[str, ...]) -> list[OxmlElement]:
+    """Render and parse a batch of same-style paragraphs in one pass."""
+    tmpl, esc = _STYLED_P_TMPL, escape
+    rendered = "".join(tmpl % (style_id, esc(text)) for text in texts)
+    return list(parse_xml(_BATCH_ROOT_TMPL % rendered))
+
+
+class _ParaBuffer:
+    """Accumulates prebuilt <w:p> nodes and inserts them into the body in one
+    pass per section.
+
+    python-docx's add_paragraph re-walks the body element on every call, which
+    grows super-linearly with document length; building the nodes directly and
+    inserting them in a single pass keeps section emission linear.
+    """
+
+    def __init__(self, doc: Document) -> None:
+        # The sectPr stays the last body child throughout the build, so both
+        # references are resolved once and every flush splices just before it.
+        self._body = doc.element.body
+        self._sect_pr = self._body.find(_QN_SECTPR)
+        self._nodes: list[OxmlElement] = []
+
+    def p(self, text: str) -> None:
+        self._nodes.append(_make_p(text))
+
+    def h1(self, title: str) -> None:
+        self._nodes.append(_make_p(title, "Heading1"))
+
+    def h2(self, title: str) -> None:
+        self._nodes.append(_make_p(title, "Heading2"))
+
+    def h3(self, title: str) -> None:
+        self._nodes.append(_make_p(title, "Heading3"))
+
+    def bullet(self, text: str) -> None:
+        self._nodes.append(_make_p(text, "ListBullet"))
+
+    def num(self, text: str) -> None:
+        self._nodes.append(_make_p(text, "ListNumber"))
+
+    def nums(self, texts: tuple[str, ...]) -> None:
+        self._nodes.extend(_parse_styled_ps("ListNumber", texts))
+
+    def page_break(self) -> None:
+        self._nodes.append(_page_break_p())
+
+    def flush(self) -> None:
+        if not self._nodes:
+            return
+        # Single bulk splice ahead of the sectPr instead of one addprevious()
+        # call (and its Python->lxml crossing) per node.
+        body = self._body
+        index = body.index(self._sect_pr)
+        body[index:index] = self._nodes
+        self._nodes.clear()
+
+
+# SECTION 4 content: only the "Purpose" bullet varies per module (None below),
+# so the block is defined once instead of re-allocating nine identical strings
+# and h3/bullet pairs for each of the thirteen modules.
+_MODULES = (
+    "Dashboard",
+    "Products",
+    "Warehouses",
+    "Stock Movements",
+    "Purchases",
+    "Sales",
+    "Reports",
+    "Users",
+    "Roles",
+    "Audit Logs",
+    "Settings",
+    "Approvals",
+    "Scan",
+)
+
+_MODULE_SUBSECTIONS: tuple[tuple[str, str | None], ...] = (
+    ("Purpose", None),
+    ("What it manages", "Entities, validations, and operational workflows relevant to this module."),
+    ("Core functionality", "Create, view, and manage records according to permissions."),
+    ("Business rules", "Rules enforced by services (stock execution rules, approval gating, validation constraints)."),
+    ("Validation rules", "Schema validation (API payload validation) and service-level checks (e.g., stock availability)."),
+    ("Data flow", "UI → API → service → Prisma → audit/integrity metrics updates."),
+    ("Role access overview", "Access is permission-based; Admin has full access; other roles are scoped."),
+    ("Common use cases", "Daily operations, reporting, and exception handling."),
+    ("Edge cases", "Approval-required actions, insufficient stock, batch/serial requirements, and invalid inputs."),
+)
+
+
+# Step-by-step guides, defined once instead of rebuilding the list literals
+# on every build_doc() call.
+_ADMIN_STEPS = (
+    "Log in as admin and review dashboard health.",
+    "Create warehouses and confirm codes/locations.",
+    "Configure valuation method (FIFO or Average) and financial visibility rules.",
+    "Configure approval policies for purchase receive, sale confirm, transfers, and adjustments.",
+    "Create roles and users; assign permissions based on job function.",
+    "Configure reorder policies per product/warehouse; recompute metrics.",
+    "Review audit logs and approvals queue regularly.",
+    "Enable/disable system lockdown according to governance policy.",
+    "Run reports and export where permitted.",
+)
+
+_MANAGER_STEPS = (
+    "Monitor dashboard KPIs and low-stock indicators.",
+    "Review the approvals queue and approve eligible requests.",
+    "Oversee purchase receiving and investigate exceptions (batch/serial mismatches).",
+    "Review stock movement history for anomalies.",
+    "Use reports to support replenishment decisions.",
+)
+
+_STAFF_STEPS = (
+    "Create or prepare purchase receive payload; include batch/serial inputs when required.",
+    "Receive purchase (or submit for approval if enabled).",
+    "Create sale and confirm sale; for serial items, select serial numbers; for batch items, select batch.",
+    "Transfer stock between warehouses (may require approval).",
+    "Perform stock adjustments with reason codes (may require approval).",
+    "Use scanning via USB/camera for fast product lookup and operational flow entry.",
+)
 
+_VIEWER_STEPS = (
+    "View dashboard for high-level visibility.",
+    "Use reports to review inventory and movement history.",
+    "Export reports only if permission allows; otherwise request access from Admin.",
+)
 
-def _h2(doc: Document, title: str) -> None:
-    doc.add_heading(title, level=2)
+_ONBOARDING_STEPS = (
+    "Create warehouses and verify default warehouse settings.",
+    "Import or create products (enable batch/serial flags where required).",
+    "Perform initial stock load via purchase receive or adjustments (with correct batch/serial inputs).",
+    "Configure approvals policies and reviewer roles (if governance required).",
+    "Configure reorder policies and recompute metrics.",
+    "Validate scanning setup (manual/USB/camera) and label process.",
+    "Run integrity verification and confirm dashboards/reports are correct.",
+    "Go-live checklist: restrict admin access, confirm backups, enable/disable system lockdown policy.",
+)
 
 
-def _h3(doc: Document, title: str) -> None:
-    doc.add_heading(title, level=3)
+_FLOWS = (
+    "Purchase Receive Flow",
+    "Sale Confirm Flow",
+    "Transfer Flow",
+    "Stock Adjustment Flow",
+    "Approval Flow",
+    "Batch Lifecycle",
+    "Serial Lifecycle",
+    "FIFO Layer Consumption Flow",
+    "Average Cost Flow",
+    "Reorder Forecast Flow",
+    "Scan & Lookup Flow",
+)
 
+_FLOW_STAGES = (
+    ("Trigger", "User action via UI/API route that initiates the workflow."),
+    ("Validation", "Schema validation + business rule checks (permissions, quantities, batch/serial requirements)."),
+    ("Service execution", "Service layer executes stock mutation through StockService when allowed."),
+    ("DB impact", "Writes ledger movements and updates balances; persists request entities where applicable."),
+    ("Status transitions", "For approval workflows: PENDING_APPROVAL → APPROVED/REJECTED → APPLIED/CONFIRMED/RECEIVED."),
+    ("Audit logs created", "Critical actions create audit entries; approvals add request/review/execution logs."),
+)
 
-def _bullet(doc: Document, text: str) -> None:
-    doc.add_paragraph(text, style="List Bullet")
+# The stage heading/bullet pairs are identical for every flow, so the twelve
+# <w:p> prototypes are built once and deep-copied per flow instead of
+# re-rendering 66 paragraphs through the buffer.
+_FLOW_BODY_PROTO = tuple(
+    p
+    for stage, text in _FLOW_STAGES
+    for p in (_make_p(stage, "Heading3"), _make_p(text, "ListBullet"))
+)
 
 
-def _num(doc: Document, text: str) -> None:
-    doc.add_paragraph(text, style="List Number")
+_GLOSSARY: tuple[tuple[str, str], ...] = (
+    ("Ledger", "Immutable record of stock movements (IN/OUT) used as the source of truth."),
+    ("Balance", "Snapshot quantity stored for fast reads; must reconcile with the ledger."),
+    ("Batch/Lot", "A grouped inventory identifier (e.g., manufacturing batch) used for traceability."),
+    ("Serial", "A unique identifier per unit; tracked through lifecycle states."),
+    ("FIFO", "First-In, First-Out valuation method consuming oldest layers first."),
+    ("Average Cost", "Valuation method using weighted average unit cost."),
+    ("COGS", "Cost of Goods Sold; the cost portion of a sale."),
+    ("Layer", "Inventory valuation layer representing acquired quantity at a unit cost."),
+    ("Days of Cover", "How long current stock lasts at the observed sales rate."),
+    ("Approval Policy", "Rules defining when an action requires approval."),
+    ("Approval Request", "A request instance awaiting review; approval triggers execution."),
+)
 
 
 def build_doc() -> Document:
@@ -157,354 +389,271 @@ def build_doc() -> Document:
     _toc(doc)
     _version_history(doc)
 
+    b = _ParaBuffer(doc)
+
     # ---------------------------------------------------------
     # SECTION 1 — EXECUTIVE SUMMARY
     # ---------------------------------------------------------
-    _h1(doc, "SECTION 1 — Executive Summary")
-    _h2(doc, "System Overview")
-    _bullet(doc, "A modular inventory management platform designed for controlled stock execution, auditability, and operational scale.")
-    _bullet(doc, "Supports warehouses, products, stock ledger, approvals, forecasting, and scanning workflows up to Phase 5.")
-    _h2(doc, "Target Audience")
-    _bullet(doc, "Operations (warehouse staff, inventory clerks, managers).")
-    _bullet(doc, "Finance/controls (read-only financial visibility where enabled).")
-    _bullet(doc, "Administrators and auditors (RBAC, audit logs, approvals).")
-    _h2(doc, "Competitive Advantages")
-    _bullet(doc, "Ledger-first stock engine: immutable movements with balance snapshots.")
-    _bullet(doc, "Approval workflow to enforce governance before execution.")
-    _bullet(doc, "Batch and serial tracking support for regulated/traceable inventory.")
-    _bullet(doc, "Barcode/scan lookup for high-throughput operations.")
-    _h2(doc, "Enterprise Readiness")
-    _bullet(doc, "Strict RBAC permissions, system roles plus customizable roles.")
-    _bullet(doc, "Audit logging for critical actions.")
-    _bullet(doc, "Integrity verification scripts for ledger vs balances.")
-    doc.add_page_break()
+    b.h1("SECTION 1 — Executive Summary")
+    b.h2("System Overview")
+    b.bullet("A modular inventory management platform designed for controlled stock execution, auditability, and operational scale.")
+    b.bullet("Supports warehouses, products, stock ledger, approvals, forecasting, and scanning workflows up to Phase 5.")
+    b.h2("Target Audience")
+    b.bullet("Operations (warehouse staff, inventory clerks, managers).")
+    b.bullet("Finance/controls (read-only financial visibility where enabled).")
+    b.bullet("Administrators and auditors (RBAC, audit logs, approvals).")
+    b.h2("Competitive Advantages")
+    b.bullet("Ledger-first stock engine: immutable movements with balance snapshots.")
+    b.bullet("Approval workflow to enforce governance before execution.")
+    b.bullet("Batch and serial tracking support for regulated/traceable inventory.")
+    b.bullet("Barcode/scan lookup for high-throughput operations.")
+    b.h2("Enterprise Readiness")
+    b.bullet("Strict RBAC permissions, system roles plus customizable roles.")
+    b.bullet("Audit logging for critical actions.")
+    b.bullet("Integrity verification scripts for ledger vs balances.")
+    b.page_break()
 
     # ---------------------------------------------------------
     # SECTION 2 — SYSTEM ARCHITECTURE
     # ---------------------------------------------------------
-    _h1(doc, "SECTION 2 — System Architecture")
-    _h2(doc, "Technical Stack")
-    _bullet(doc, "Next.js 15 (App Router), TypeScript (strict).")
-    _bullet(doc, "Prisma ORM + PostgreSQL.")
-    _bullet(doc, "NextAuth (Credentials) for authentication; JWT session strategy.")
-    _h2(doc, "Service Structure (Architecture Rules)")
-    _bullet(doc, "Route handlers are thin; business logic lives in server/services; data access in server/repositories.")
-    _bullet(doc, "StockService is the only stock mutator; do not write stock ledger/balances directly.")
-    _h2(doc, "Stock Engine: Ledger + Balances")
-    _bullet(doc, "Ledger: stock_movements (immutable; IN/OUT) with references (PURCHASE/SALE/TRANSFER/ADJUSTMENT).")
-    _bullet(doc, "Balances: stock_balances as snapshot per product/warehouse (+ optional batchId).")
-    _bullet(doc, "Transfers execute as two movements with a shared referenceId in one transaction.")
-    _h2(doc, "Approval Engine (Phase 4)")
-    _bullet(doc, "Policies define which entity actions require approval.")
-    _bullet(doc, "ApprovalRequest lifecycle: PENDING → APPROVED/REJECTED/CANCELLED.")
-    _bullet(doc, "Execution is idempotent: approving an already-approved request does not execute twice.")
-    _h2(doc, "Forecasting Engine (Phase 3)")
-    _bullet(doc, "InventoryMetricsService computes avgDailySales, daysOfCover, predictedStockoutDate, suggestedReorderQty.")
-    _bullet(doc, "ReorderPolicy per product+warehouse defines leadTimeDays, min/max, safety stock.")
-    _h2(doc, "Scanning Architecture (Phase 5)")
-    _bullet(doc, "Scan lookup endpoint resolves codes (e.g., product.barcode / sku / serial numbers) for quick retrieval.")
-    _bullet(doc, "Database indexes support lookup performance (e.g., Product.barcode, ProductSerial.serialNumber).")
-    _h2(doc, "High-Level Data Flow")
-    _bullet(doc, "UI → API route handler → service layer (validation + rules) → repositories/Prisma → audit log.")
-    doc.add_page_break()
+    b.h1("SECTION 2 — System Architecture")
+    b.h2("Technical Stack")
+    b.bullet("Next.js 15 (App Router), TypeScript (strict).")
+    b.bullet("Prisma ORM + PostgreSQL.")
+    b.bullet("NextAuth (Credentials) for authentication; JWT session strategy.")
+    b.h2("Service Structure (Architecture Rules)")
+    b.bullet("Route handlers are thin; business logic lives in server/services; data access in server/repositories.")
+    b.bullet("StockService is the only stock mutator; do not write stock ledger/balances directly.")
+    b.h2("Stock Engine: Ledger + Balances")
+    b.bullet("Ledger: stock_movements (immutable; IN/OUT) with references (PURCHASE/SALE/TRANSFER/ADJUSTMENT).")
+    b.bullet("Balances: stock_balances as snapshot per product/warehouse (+ optional batchId).")
+    b.bullet("Transfers execute as two movements with a shared referenceId in one transaction.")
+    b.h2("Approval Engine (Phase 4)")
+    b.bullet("Policies define which entity actions require approval.")
+    b.bullet("ApprovalRequest lifecycle: PENDING → APPROVED/REJECTED/CANCELLED.")
+    b.bullet("Execution is idempotent: approving an already-approved request does not execute twice.")
+    b.h2("Forecasting Engine (Phase 3)")
+    b.bullet("InventoryMetricsService computes avgDailySales, daysOfCover, predictedStockoutDate, suggestedReorderQty.")
+    b.bullet("ReorderPolicy per product+warehouse defines leadTimeDays, min/max, safety stock.")
+    b.h2("Scanning Architecture (Phase 5)")
+    b.bullet("Scan lookup endpoint resolves codes (e.g., product.barcode / sku / serial numbers) for quick retrieval.")
+    b.bullet("Database indexes support lookup performance (e.g., Product.barcode, ProductSerial.serialNumber).")
+    b.h2("High-Level Data Flow")
+    b.bullet("UI → API route handler → service layer (validation + rules) → repositories/Prisma → audit log.")
+    b.page_break()
 
     # ---------------------------------------------------------
     # SECTION 3 — DATABASE & BUSINESS LOGIC
     # ---------------------------------------------------------
-    _h1(doc, "SECTION 3 — Database & Business Logic")
-    _h2(doc, "Ledger Principle")
-    _bullet(doc, "All inventory changes are recorded as immutable stock_movements.")
-    _bullet(doc, "Movements are never edited/deleted; corrections happen via new movements (e.g., adjustment).")
-    _h2(doc, "Balance Snapshot Principle")
-    _bullet(doc, "stock_balances stores the current snapshot for fast reads; it must match SUM(ledger movements).")
-    _bullet(doc, "Integrity verification checks balances vs ledger and transfer consistency.")
-    _h2(doc, "Transfers Create Two Movements")
-    _bullet(doc, "A transfer creates one OUT movement from source and one IN movement to destination, with the same referenceId.")
-    _h2(doc, "Approvals Block Execution")
-    _bullet(doc, "When approval is required, the system creates a request and defers stock mutation until approved.")
-    _h2(doc, "Batch & Serial Rules")
-    _bullet(doc, "Batch-tracked products require batchId/batchNumber on IN and batchId on OUT.")
-    _bullet(doc, "Serial-tracked products require serial numbers on OUT; serials transition status (e.g., IN_STOCK → SOLD).")
-    _h2(doc, "FIFO vs Average Cost (Phase 2)")
-    _bullet(doc, "Valuation method is stored in Settings. InventoryLayer/Consumption tables exist to support costing.")
-    _bullet(doc, "COGS and margin fields exist on sales items for reporting when valuation/COGS logic is enabled.")
-    _h2(doc, "Reorder Forecasting Formulas (Phase 3)")
-    _bullet(doc, "Avg daily sales = total sold qty over lookback / lookbackDays.")
-    _bullet(doc, "Days of cover = currentStock / avgDailySales (if avgDailySales > 0).")
-    _bullet(doc, "Suggested reorder qty = max(0, leadDemand + safetyStock − currentStock).")
-    doc.add_page_break()
+    b.h1("SECTION 3 — Database & Business Logic")
+    b.h2("Ledger Principle")
+    b.bullet("All inventory changes are recorded as immutable stock_movements.")
+    b.bullet("Movements are never edited/deleted; corrections happen via new movements (e.g., adjustment).")
+    b.h2("Balance Snapshot Principle")
+    b.bullet("stock_balances stores the current snapshot for fast reads; it must match SUM(ledger movements).")
+    b.bullet("Integrity verification checks balances vs ledger and transfer consistency.")
+    b.h2("Transfers Create Two Movements")
+    b.bullet("A transfer creates one OUT movement from source and one IN movement to destination, with the same referenceId.")
+    b.h2("Approvals Block Execution")
+    b.bullet("When approval is required, the system creates a request and defers stock mutation until approved.")
+    b.h2("Batch & Serial Rules")
+    b.bullet("Batch-tracked products require batchId/batchNumber on IN and batchId on OUT.")
+    b.bullet("Serial-tracked products require serial numbers on OUT; serials transition status (e.g., IN_STOCK → SOLD).")
+    b.h2("FIFO vs Average Cost (Phase 2)")
+    b.bullet("Valuation method is stored in Settings. InventoryLayer/Consumption tables exist to support costing.")
+    b.bullet("COGS and margin fields exist on sales items for reporting when valuation/COGS logic is enabled.")
+    b.h2("Reorder Forecasting Formulas (Phase 3)")
+    b.bullet("Avg daily sales = total sold qty over lookback / lookbackDays.")
+    b.bullet("Days of cover = currentStock / avgDailySales (if avgDailySales > 0).")
+    b.bullet("Suggested reorder qty = max(0, leadDemand + safetyStock − currentStock).")
+    b.page_break()
 
     # ---------------------------------------------------------
     # SECTION 4 — COMPLETE MODULE DOCUMENTATION
     # ---------------------------------------------------------
-    _h1(doc, "SECTION 4 — Complete Module Documentation")
-
-    modules = [
-        "Dashboard",
-        "Products",
-        "Warehouses",
-        "Stock Movements",
-        "Purchases",
-        "Sales",
-        "Reports",
-        "Users",
-        "Roles",
-        "Audit Logs",
-        "Settings",
-        "Approvals",
-        "Scan",
-    ]
-
-    for m in modules:
-        _h2(doc, m)
-        _h3(doc, "Purpose")
-        _bullet(doc, f"Provides the primary capabilities for {m.lower()} management and visibility.")
-        _h3(doc, "What it manages")
-        _bullet(doc, "Entities, validations, and operational workflows relevant to this module.")
-        _h3(doc, "Core functionality")
-        _bullet(doc, "Create, view, and manage records according to permissions.")
-        _h3(doc, "Business rules")
-        _bullet(doc, "Rules enforced by services (stock execution rules, approval gating, validation constraints).")
-        _h3(doc, "Validation rules")
-        _bullet(doc, "Schema validation (API payload validation) and service-level checks (e.g., stock availability).")
-        _h3(doc, "Data flow")
-        _bullet(doc, "UI → API → service → Prisma → audit/integrity metrics updates.")
-        _h3(doc, "Role access overview")
-        _bullet(doc, "Access is permission-based; Admin has full access; other roles are scoped.")
-        _h3(doc, "Common use cases")
-        _bullet(doc, "Daily operations, reporting, and exception handling.")
-        _h3(doc, "Edge cases")
-        _bullet(doc, "Approval-required actions, insufficient stock, batch/serial requirements, and invalid inputs.")
+    b.h1("SECTION 4 — Complete Module Documentation")
 
-    doc.add_page_break()
+    for m in _MODULES:
+        b.h2(m)
+        purpose = f"Provides the primary capabilities for {m.lower()} management and visibility."
+        for sub, text in _MODULE_SUBSECTIONS:
+            b.h3(sub)
+            b.bullet(text if text is not None else purpose)
+
+    b.page_break()
 
     # ---------------------------------------------------------
     # SECTION 5 — ROLE-BASED COMPLETE FUNCTIONAL GUIDE
     # ---------------------------------------------------------
-    _h1(doc, "SECTION 5 — Role-Based Complete Functional Guide")
-    _h2(doc, "Role Model")
-    _bullet(doc, "System supports default roles (Admin/Manager/Staff/Viewer) and custom roles (permission-based).")
-    _bullet(doc, "Custom roles can be created and assigned with specific permissions (e.g., warehouse_lead).")
-
-    _h2(doc, "Admin")
-    _bullet(doc, "Can see/create/edit/delete across modules; can configure approvals, roles, and settings.")
-    _bullet(doc, "Approval authority depends on policy and permissions (approvals.review/manage).")
-    _h3(doc, "Admin step-by-step guide")
-    for step in [
-        "Log in as admin and review dashboard health.",
-        "Create warehouses and confirm codes/locations.",
-        "Configure valuation method (FIFO or Average) and financial visibility rules.",
-        "Configure approval policies for purchase receive, sale confirm, transfers, and adjustments.",
-        "Create roles and users; assign permissions based on job function.",
-        "Configure reorder policies per product/warehouse; recompute metrics.",
-        "Review audit logs and approvals queue regularly.",
-        "Enable/disable system lockdown according to governance policy.",
-        "Run reports and export where permitted.",
-    ]:
-        _num(doc, step)
-
-    _h2(doc, "Manager")
-    _bullet(doc, "Can operate inventory workflows, review reports, and review/approve where permitted.")
-    _h3(doc, "Manager step-by-step guide")
-    for step in [
-        "Monitor dashboard KPIs and low-stock indicators.",
-        "Review the approvals queue and approve eligible requests.",
-        "Oversee purchase receiving and investigate exceptions (batch/serial mismatches).",
-        "Review stock movement history for anomalies.",
-        "Use reports to support replenishment decisions.",
-    ]:
-        _num(doc, step)
-
-    _h2(doc, "Staff")
-    _bullet(doc, "Executes operational workflows (receive, confirm, transfer, adjust) subject to permissions and approvals.")
-    _h3(doc, "Staff step-by-step guide")
-    for step in [
-        "Create or prepare purchase receive payload; include batch/serial inputs when required.",
-        "Receive purchase (or submit for approval if enabled).",
-        "Create sale and confirm sale; for serial items, select serial numbers; for batch items, select batch.",
-        "Transfer stock between warehouses (may require approval).",
-        "Perform stock adjustments with reason codes (may require approval).",
-        "Use scanning via USB/camera for fast product lookup and operational flow entry.",
-    ]:
-        _num(doc, step)
-
-    _h2(doc, "Viewer")
-    _bullet(doc, "Read-only access to dashboards and reports; cannot execute stock-changing actions.")
-    _h3(doc, "Viewer step-by-step guide")
-    for step in [
-        "View dashboard for high-level visibility.",
-        "Use reports to review inventory and movement history.",
-        "Export reports only if permission allows; otherwise request access from Admin.",
-    ]:
-        _num(doc, step)
-
-    doc.add_page_break()
+    b.h1("SECTION 5 — Role-Based Complete Functional Guide")
+    b.h2("Role Model")
+    b.bullet("System supports default roles (Admin/Manager/Staff/Viewer) and custom roles (permission-based).")
+    b.bullet("Custom roles can be created and assigned with specific permissions (e.g., warehouse_lead).")
+
+    b.h2("Admin")
+    b.bullet("Can see/create/edit/delete across modules; can configure approvals, roles, and settings.")
+    b.bullet("Approval authority depends on policy and permissions (approvals.review/manage).")
+    b.h3("Admin step-by-step guide")
+    b.nums(_ADMIN_STEPS)
+
+    b.h2("Manager")
+    b.bullet("Can operate inventory workflows, review reports, and review/approve where permitted.")
+    b.h3("Manager step-by-step guide")
+    b.nums(_MANAGER_STEPS)
+
+    b.h2("Staff")
+    b.bullet("Executes operational workflows (receive, confirm, transfer, adjust) subject to permissions and approvals.")
+    b.h3("Staff step-by-step guide")
+    b.nums(_STAFF_STEPS)
+
+    b.h2("Viewer")
+    b.bullet("Read-only access to dashboards and reports; cannot execute stock-changing actions.")
+    b.h3("Viewer step-by-step guide")
+    b.nums(_VIEWER_STEPS)
+
+    b.page_break()
 
     # ---------------------------------------------------------
     # SECTION 6 — COMPLETE FEATURE FLOWS
     # ---------------------------------------------------------
-    _h1(doc, "SECTION 6 — Complete Feature Flows")
-
-    flows = [
-        "Purchase Receive Flow",
-        "Sale Confirm Flow",
-        "Transfer Flow",
-        "Stock Adjustment Flow",
-        "Approval Flow",
-        "Batch Lifecycle",
-        "Serial Lifecycle",
-        "FIFO Layer Consumption Flow",
-        "Average Cost Flow",
-        "Reorder Forecast Flow",
-        "Scan & Lookup Flow",
-    ]
-
-    for f in flows:
-        _h2(doc, f)
-        _h3(doc, "Trigger")
-        _bullet(doc, "User action via UI/API route that initiates the workflow.")
-        _h3(doc, "Validation")
-        _bullet(doc, "Schema validation + business rule checks (permissions, quantities, batch/serial requirements).")
-        _h3(doc, "Service execution")
-        _bullet(doc, "Service layer executes stock mutation through StockService when allowed.")
-        _h3(doc, "DB impact")
-        _bullet(doc, "Writes ledger movements and updates balances; persists request entities where applicable.")
-        _h3(doc, "Status transitions")
-        _bullet(doc, "For approval workflows: PENDING_APPROVAL → APPROVED/REJECTED → APPLIED/CONFIRMED/RECEIVED.")
-        _h3(doc, "Audit logs created")
-        _bullet(doc, "Critical actions create audit entries; approvals add request/review/execution logs.")
+    b.h1("SECTION 6 — Complete Feature Flows")
 
-    doc.add_page_break()
+    for f in _FLOWS:
+        b.h2(f)
+        b._nodes.extend(deepcopy(node) for node in _FLOW_BODY_PROTO)
+
+    b.page_break()
 
     # ---------------------------------------------------------
     # SECTION 7 — SMART REORDER & FORECASTING
     # ---------------------------------------------------------
-    _h1(doc, "SECTION 7 — Smart Reorder & Forecasting")
-    _h2(doc, "Formulas")
-    _bullet(doc, "Avg daily sales = SUM(sales qty over lookback) / lookbackDays.")
-    _bullet(doc, "Days of cover = currentStock / avgDailySales (when avgDailySales > 0).")
-    _bullet(doc, "Suggested reorder qty = max(0, leadTimeDays*avgDailySales + safetyStock − currentStock).")
-    _h2(doc, "Stockout Prediction Logic")
-    _bullet(doc, "predictedStockoutDate is computed as now + daysOfCover when avgDailySales > 0.")
-    _h2(doc, "Dashboard Integration")
-    _bullet(doc, "Metrics are stored in inventory_metrics for fast dashboard rendering.")
-    doc.add_page_break()
+    b.h1("SECTION 7 — Smart Reorder & Forecasting")
+    b.h2("Formulas")
+    b.bullet("Avg daily sales = SUM(sales qty over lookback) / lookbackDays.")
+    b.bullet("Days of cover = currentStock / avgDailySales (when avgDailySales > 0).")
+    b.bullet("Suggested reorder qty = max(0, leadTimeDays*avgDailySales + safetyStock − currentStock).")
+    b.h2("Stockout Prediction Logic")
+    b.bullet("predictedStockoutDate is computed as now + daysOfCover when avgDailySales > 0.")
+    b.h2("Dashboard Integration")
+    b.bullet("Metrics are stored in inventory_metrics for fast dashboard rendering.")
+    b.page_break()
 
     # ---------------------------------------------------------
     # SECTION 8 — VALUATION & FINANCIAL LOGIC
     # ---------------------------------------------------------
-    _h1(doc, "SECTION 8 — Valuation & Financial Logic")
-    _h2(doc, "FIFO Example")
-    _bullet(doc, "Example: buy 10 units @ $5, then 10 units @ $7. Sell 12 units → COGS = 10*$5 + 2*$7 = $64.")
-    _h2(doc, "Average Cost Example")
-    _bullet(doc, "Example: same purchases → average = (10*$5 + 10*$7)/20 = $6. Sell 12 → COGS = 12*$6 = $72.")
-    _h2(doc, "COGS and Margin")
-    _bullet(doc, "COGS is recorded per sale item when valuation logic is enabled; margin = revenue − COGS.")
-    _h2(doc, "Permission Gating")
-    _bullet(doc, "Financial visibility should be controlled by permissions (e.g., financials.read) and Settings.showFinancials.")
-    doc.add_page_break()
+    b.h1("SECTION 8 — Valuation & Financial Logic")
+    b.h2("FIFO Example")
+    b.bullet("Example: buy 10 units @ $5, then 10 units @ $7. Sell 12 units → COGS = 10*$5 + 2*$7 = $64.")
+    b.h2("Average Cost Example")
+    b.bullet("Example: same purchases → average = (10*$5 + 10*$7)/20 = $6. Sell 12 → COGS = 12*$6 = $72.")
+    b.h2("COGS and Margin")
+    b.bullet("COGS is recorded per sale item when valuation logic is enabled; margin = revenue − COGS.")
+    b.h2("Permission Gating")
+    b.bullet("Financial visibility should be controlled by permissions (e.g., financials.read) and Settings.showFinancials.")
+    b.page_break()
 
     # ---------------------------------------------------------
     # SECTION 9 — APPROVAL WORKFLOW ENGINE
     # ---------------------------------------------------------
-    _h1(doc, "SECTION 9 — Approval Workflow Engine")
-    _h2(doc, "Policy Configuration")
-    _bullet(doc, "ApprovalPolicy per entity type toggles whether approval is required.")
-    _bullet(doc, "Policies can include permission requirements and thresholds (e.g., minAmount).")
-    _h2(doc, "Lifecycle: Pending → Approved → Executed")
-    _bullet(doc, "Request is created PENDING; reviewers approve/reject; approval execution performs the stock mutation.")
-    _h2(doc, "Idempotency")
-    _bullet(doc, "If an approval is already approved/executed, re-approving will not execute again.")
-    _h2(doc, "Rejection Behavior")
-    _bullet(doc, "Rejected requests do not mutate stock; entity status transitions to REJECTED where applicable.")
-    _h2(doc, "Audit Trail")
-    _bullet(doc, "Approval requests, reviews, cancellations, and executions are audited.")
-    doc.add_page_break()
+    b.h1("SECTION 9 — Approval Workflow Engine")
+    b.h2("Policy Configuration")
+    b.bullet("ApprovalPolicy per entity type toggles whether approval is required.")
+    b.bullet("Policies can include permission requirements and thresholds (e.g., minAmount).")
+    b.h2("Lifecycle: Pending → Approved → Executed")
+    b.bullet("Request is created PENDING; reviewers approve/reject; approval execution performs the stock mutation.")
+    b.h2("Idempotency")
+    b.bullet("If an approval is already approved/executed, re-approving will not execute again.")
+    b.h2("Rejection Behavior")
+    b.bullet("Rejected requests do not mutate stock; entity status transitions to REJECTED where applicable.")
+    b.h2("Audit Trail")
+    b.bullet("Approval requests, reviews, cancellations, and executions are audited.")
+    b.page_break()
 
     # ---------------------------------------------------------
     # SECTION 10 — BARCODE & SCANNING GUIDE
     # ---------------------------------------------------------
-    _h1(doc, "SECTION 10 — Barcode & Scanning Guide")
-    _h2(doc, "Modes")
-    _bullet(doc, "Manual entry: user types or pastes a code.")
-    _bullet(doc, "USB scanner: behaves like keyboard input, submits the scanned code.")
-    _bullet(doc, "Camera scanning: uses device camera; best on mobile over HTTPS.")
-    _h2(doc, "Lookup Resolution Priority")
-    _bullet(doc, "Typical resolution: product barcode → SKU → serial number → batch barcode/number (as supported).")
-    _h2(doc, "Performance & Indexing")
-    _bullet(doc, "Ensure indexed columns exist (Product.barcode, ProductSerial.serialNumber, Batch.barcode).")
-    doc.add_page_break()
+    b.h1("SECTION 10 — Barcode & Scanning Guide")
+    b.h2("Modes")
+    b.bullet("Manual entry: user types or pastes a code.")
+    b.bullet("USB scanner: behaves like keyboard input, submits the scanned code.")
+    b.bullet("Camera scanning: uses device camera; best on mobile over HTTPS.")
+    b.h2("Lookup Resolution Priority")
+    b.bullet("Typical resolution: product barcode → SKU → serial number → batch barcode/number (as supported).")
+    b.h2("Performance & Indexing")
+    b.bullet("Ensure indexed columns exist (Product.barcode, ProductSerial.serialNumber, Batch.barcode).")
+    b.page_break()
 
     # ---------------------------------------------------------
     # SECTION 11 — ONBOARDING GUIDE FOR NEW BUSINESS
     # ---------------------------------------------------------
-    _h1(doc, "SECTION 11 — Onboarding Guide for New Business")
-    for step in [
-        "Create warehouses and verify default warehouse settings.",
-        "Import or create products (enable batch/serial flags where required).",
-        "Perform initial stock load via purchase receive or adjustments (with correct batch/serial inputs).",
-        "Configure approvals policies and reviewer roles (if governance required).",
-        "Configure reorder policies and recompute metrics.",
-        "Validate scanning setup (manual/USB/camera) and label process.",
-        "Run integrity verification and confirm dashboards/reports are correct.",
-        "Go-live checklist: restrict admin access, confirm backups, enable/disable system lockdown policy.",
-    ]:
-        _num(doc, step)
-    doc.add_page_break()
+    b.h1("SECTION 11 — Onboarding Guide for New Business")
+    b.nums(_ONBOARDING_STEPS)
+    b.page_break()
 
     # ---------------------------------------------------------
     # SECTION 12 — TROUBLESHOOTING & FAQ
     # ---------------------------------------------------------
-    _h1(doc, "SECTION 12 — Troubleshooting & FAQ")
-    _h2(doc, "Common Issues")
-    _bullet(doc, "Stock not updating: ensure action was executed (not pending approval) and that StockService was used.")
-    _bullet(doc, "Approval blocking execution: check ApprovalPolicy and approval request status.")
-    _bullet(doc, "Serial mismatch: serialNumbers count must equal quantity; serial must be IN_STOCK in the selected warehouse.")
-    _bullet(doc, "Batch required: batch-tracked products require batch input/selection for IN/OUT.")
-    _bullet(doc, "Negative stock blocked: Settings.allowNegativeStock=false prevents stock from going below zero.")
-    _bullet(doc, "Scan not found: verify code source (barcode vs SKU vs serial), indexing, and product activation.")
-    _bullet(doc, "Dashboard delay: metrics recomputation may run after execution; recompute metrics if needed.")
-    _bullet(doc, "Integrity mismatch: run integrity checks; investigate missing transfer pairs or manual data edits.")
-    doc.add_page_break()
+    b.h1("SECTION 12 — Troubleshooting & FAQ")
+    b.h2("Common Issues")
+    b.bullet("Stock not updating: ensure action was executed (not pending approval) and that StockService was used.")
+    b.bullet("Approval blocking execution: check ApprovalPolicy and approval request status.")
+    b.bullet("Serial mismatch: serialNumbers count must equal quantity; serial must be IN_STOCK in the selected warehouse.")
+    b.bullet("Batch required: batch-tracked products require batch input/selection for IN/OUT.")
+    b.bullet("Negative stock blocked: Settings.allowNegativeStock=false prevents stock from going below zero.")
+    b.bullet("Scan not found: verify code source (barcode vs SKU vs serial), indexing, and product activation.")
+    b.bullet("Dashboard delay: metrics recomputation may run after execution; recompute metrics if needed.")
+    b.bullet("Integrity mismatch: run integrity checks; investigate missing transfer pairs or manual data edits.")
+    b.page_break()
 
     # ---------------------------------------------------------
     # SECTION 13 — GLOSSARY
     # ---------------------------------------------------------
-    _h1(doc, "SECTION 13 — Glossary")
-    glossary = [
-        ("Ledger", "Immutable record of stock movements (IN/OUT) used as the source of truth."),
-        ("Balance", "Snapshot quantity stored for fast reads; must reconcile with the ledger."),
-        ("Batch/Lot", "A grouped inventory identifier (e.g., manufacturing batch) used for traceability."),
-        ("Serial", "A unique identifier per unit; tracked through lifecycle states."),
-        ("FIFO", "First-In, First-Out valuation method consuming oldest layers first."),
-        ("Average Cost", "Valuation method using weighted average unit cost."),
-        ("COGS", "Cost of Goods Sold; the cost portion of a sale."),
-        ("Layer", "Inventory valuation layer representing acquired quantity at a unit cost."),
-        ("Days of Cover", "How long current stock lasts at the observed sales rate."),
-        ("Approval Policy", "Rules defining when an action requires approval."),
-        ("Approval Request", "A request instance awaiting review; approval triggers execution."),
-    ]
-    for term, desc in glossary:
-        _h2(doc, term)
-        doc.add_paragraph(desc)
-
+    b.h1("SECTION 13 — Glossary")
+    b.flush()
+    # One term/definition table appended in a single parse instead of 22
+    # heading/paragraph inserts.
+    rows = "".join(
+        "<w:tr>"
+        + "".join(
+            f'<w:tc><w:p><w:r><w:t xml:space="preserve">{escape(text)}</w:t></w:r></w:p></w:tc>'
+            for text in (term, desc)
+        )
+        + "</w:tr>"
+        for term, desc in _GLOSSARY
+    )
+    doc.element.body.find(_QN_SECTPR).addprevious(
+        parse_xml(
+            f'<w:tbl {nsdecls("w")}><w:tblPr/>'
+            "<w:tblGrid><w:gridCol/><w:gridCol/></w:tblGrid>"
+            f"{rows}</w:tbl>"
+        )
+    )
     return doc
 
 
 def main() -> None:
     doc = build_doc()
-    try:
-        os.makedirs(os.path.dirname(OUTPUT_PATH), exist_ok=True)
-        doc.save(OUTPUT_PATH)
-        print(f"Saved: {OUTPUT_PATH}")
+    # Serialize once to memory; doc.save(path) would issue many small zip
+    # writes against the target mount and re-run the full serialization if
+    # the fallback path is needed.
+    buf = io.BytesIO()
+    doc.save(buf)
+    blob = buf.getvalue()
+
+    attempts = (
+        ("Saved", OUTPUT_PATH),
+        ("Saved (fallback)", _FALLBACK_ABS),
+    )
+    for label, path in attempts:
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as f:
+                f.write(blob)
+        except OSError:
+            continue
+        print(f"{label}: {path}")
         return
-    except OSError:
-        pass
-
-    fallback_dir = os.path.dirname(os.path.abspath(FALLBACK_OUTPUT_PATH))
-    os.makedirs(fallback_dir, exist_ok=True)
-    doc.save(os.path.abspath(FALLBACK_OUTPUT_PATH))
-    print(f"Saved (fallback): {os.path.abspath(FALLBACK_OUTPUT_PATH)}")
+    raise RuntimeError("Unable to save the document to the primary or fallback output path.")
 
 
 if __name__ == "__main__":